@@ -2,36 +2,520 @@
 # -------------
 
 import os
-import gc
 import re
 import time
 import subprocess
+import tempfile
 import logging
 from tqdm import tqdm
-import numpy as np
-from typing import Optional, List
-from functools import lru_cache
+from typing import Optional, List, Dict, Literal, Tuple
 from rich.box import ROUNDED
 from rich.table import Table
 from rich.console import Console
 from rich.panel import Panel
 from rich.traceback import install
 from rich.syntax import Syntax
+from rich.progress import (
+    Progress,
+    TextColumn,
+    BarColumn,
+    TaskProgressColumn,
+    TimeElapsedColumn,
+)
 from pathlib import Path
+import queue
+import selectors
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
 
 install(show_locals=True)
 console = Console()
 
+# ONE SHARED LOGGER; THE HANDLER IS ATTACHED ONCE SO CREATING SEVERAL
+# ffpe() INSTANCES DOES NOT DUPLICATE EVERY LOG LINE.
+logger = logging.getLogger("ffpe_logger")
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    )
+    logger.addHandler(_handler)
+
+# BUNDLED BINARIES, RESOLVED ONCE AT IMPORT. OUTSIDE WINDOWS A BINARY
+# WITHOUT THE ".exe" SUFFIX IS PREFERRED WHEN ONE IS SHIPPED NEXT TO IT.
+_BIN = Path(__file__).resolve().parent / "bin"
+
+
+def _bin_path(name: str) -> Path:
+    if os.name != "nt" and (_BIN / name).is_file():
+        return _BIN / name
+    return _BIN / f"{name}.exe"
+
+
+FFPE_PATH = _bin_path("ffpe")
+FFPR_PATH = _bin_path("ffpr")
+
+# OPTIONS EVERY LONG-RUNNING FFPE COMMAND STARTS WITH. "-nostdin" KEEPS
+# CONCURRENT FFPE PROCESSES FROM READING (AND STEALING) TERMINAL INPUT.
+_BASE_OPTIONS = ("-hide_banner", "-nostdin")
+
+# NUMBER OF ENCODER THREADS GIVEN TO EACH FFPE PROCESS.
+THREADS_PER_JOB = 4
+
+# MEMORY PROFILES: (THREADS, OPTIONS BEFORE "-i", LOW-LATENCY TUNE). EVERY
+# ENCODER THREAD HOLDS ITS OWN FRAMES IN FLIGHT, AND THE LOW-LATENCY TUNE
+# DROPS THE FRAME LOOKAHEAD, SO "low" CUTS PEAK MEMORY PER JOB TO ABOUT A
+# THIRD AT THE COST OF COMPRESSION EFFICIENCY AND SPEED.
+_MEM_PROFILES = {
+    "quality": (None, [], False),
+    "balanced": (THREADS_PER_JOB, ["-filter_threads", "2"], False),
+    "low": (2, ["-filter_threads", "1", "-thread_queue_size", "128"], True),
+}
+
+# "-tune" VALUE THAT DROPS THE FRAME LOOKAHEAD, PER VIDEO ENCODER. OTHER
+# ENCODERS GET NO "-tune", SINCE THEIR VALUES DIFFER OR DO NOT EXIST.
+_LOW_LATENCY_TUNES = {
+    "h264": "zerolatency",
+    "hevc": "zerolatency",
+    "libx264": "zerolatency",
+    "libx265": "zerolatency",
+    "h264_nvenc": "ull",
+    "hevc_nvenc": "ull",
+}
+
+# CODEC TYPE LETTER (THIRD FEATURE COLUMN OF "-codecs") TO ITS NAME.
+_CODEC_TYPES = {
+    "V": "VIDEO",
+    "A": "AUDIO",
+    "S": "SUBTITLE",
+    "D": "DATA",
+    "T": "ATTACHMENT",
+}
+
+# HARDWARE ENCODER TO USE FOR (HWACCEL, SOFTWARE VIDEO CODEC).
+_HW_ENCODER_MAP = {
+    ("cuda", "h264"): "h264_nvenc",
+    ("cuda", "libx264"): "h264_nvenc",
+    ("cuda", "hevc"): "hevc_nvenc",
+    ("cuda", "libx265"): "hevc_nvenc",
+    ("qsv", "h264"): "h264_qsv",
+    ("qsv", "hevc"): "hevc_qsv",
+}
+
+# PRESET TO PASS TO EACH HARDWARE ENCODER FAMILY, KEYED BY THE x264 OR
+# NATIVE PRESET NAME THE USER GAVE. A PRESET MISSING HERE KEEPS THE
+# SOFTWARE ENCODER, SINCE THE HARDWARE ONE WOULD REJECT IT.
+_HW_PRESETS = {
+    "nvenc": {
+        "ultrafast": "p1",
+        "superfast": "p1",
+        "veryfast": "p2",
+        "faster": "p3",
+        "fast": "p3",
+        "medium": "p4",
+        "slow": "p5",
+        "slower": "p6",
+        "veryslow": "p7",
+        **{f"p{i}": f"p{i}" for i in range(1, 8)},
+    },
+    "qsv": {
+        "ultrafast": "veryfast",
+        "superfast": "veryfast",
+        "veryfast": "veryfast",
+        "faster": "faster",
+        "fast": "fast",
+        "medium": "medium",
+        "slow": "slow",
+        "slower": "slower",
+        "veryslow": "veryslow",
+    },
+}
+
+
+def _features_str(features):
+    """
+    >>> TURN A FEATURE COLUMN SUCH AS "DEV.L." INTO ".D.E.V.L".
+    """
+    return "".join("." + flag for flag in features.upper() if flag != ".")
+
+
+def _missing_files(paths):
+    """
+    >>> RETURN THE PATHS THAT DO NOT EXIST. DIRECTORIES HOLDING SEVERAL OF
+    >>> THE PATHS ARE LISTED ONCE WITH "os.scandir" INSTEAD OF ONE STAT PER FILE.
+    >>> A NAME NOT IN THE LISTING IS STILL CHECKED WITH "os.path.exists", SINCE
+    >>> A CASE-INSENSITIVE FILESYSTEM MAY SPELL IT DIFFERENTLY.
+    """
+    groups = defaultdict(set)
+    for path in paths:
+        directory, name = os.path.split(path)
+        groups[directory].add(name)
+
+    existing = {}
+    for directory, names in groups.items():
+        if len(names) > 1:
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    existing[directory] = {
+                        os.path.normcase(entry.name) for entry in entries
+                    }
+            except OSError:
+                pass  # UNLISTABLE (E.G. EXECUTE-ONLY); STAT EACH FILE INSTEAD.
+
+    missing = []
+    for path in paths:
+        directory, name = os.path.split(path)
+        listed = existing.get(directory)
+        if listed is not None and os.path.normcase(name) in listed:
+            continue
+        if not os.path.exists(path):
+            missing.append(path)
+    return missing
+
 
 def clear_console():
     # CLEAR CONSOLE SCREEN.
     """
     >>> CLEAR SCREEN FUNCTION.
     """
-    if os.name == "nt":
-        _ = os.system("cls")  # FOR WINDOWS
+    # RICH WRITES NOTHING WHEN STDOUT IS NOT A TERMINAL. ITS LEGACY WINDOWS
+    # RENDERER (NO VT SUPPORT) DROPS THE CLEAR CONTROL, SO THOSE CONSOLES
+    # STILL GO THROUGH "cls".
+    if console.legacy_windows and console.is_terminal:
+        os.system("cls")
+    else:
+        console.clear()
+
+
+@dataclass(frozen=True)
+class FfpeJob:
+    """
+    >>> ONE FFPE CONVERSION.
+    """
+
+    ffpe_path: str
+    input_file: str
+    output_file: str
+    duration: float
+    index: int = 1
+    cv: Optional[str] = None
+    ca: Optional[str] = None
+    s: Optional[str] = None
+    hwaccel: Optional[str] = None
+    ar: Optional[int] = None
+    ac: Optional[int] = None
+    ba: Optional[int] = None
+    r: Optional[int] = None
+    f: Optional[str] = None
+    preset: Optional[str] = None
+    bv: Optional[int] = None
+    threads: Optional[int] = None
+    mem_profile: str = "quality"
+    # (PATH, VIDEO CODEC, VIDEO BITRATE, RESOLUTION, PRESET) PER OUTPUT OF A
+    # MULTI-OUTPUT JOB. WHEN SET, "output_file", "cv", "s", "bv", "f" AND
+    # "preset" ARE NOT USED.
+    outputs: Tuple[Tuple[Optional[str], ...], ...] = ()
+
+
+def _build_command(job: FfpeJob) -> List[str]:
+    """
+    >>> BUILD THE FFPE COMMAND LINE FOR A JOB.
+    """
+    # BUILD THE FFMPEG COMMAND BASED ON THE PROVIDED PARAMETERS.
+    command = [job.ffpe_path, *_BASE_OPTIONS, "-nostats", "-progress", "pipe:1"]
+
+    if job.hwaccel:
+        command += ["-hwaccel", job.hwaccel]
+        # KEEP DECODED FRAMES ON THE GPU FOR NVENC, UNLESS "-s" NEEDS TO
+        # SCALE THEM IN SOFTWARE.
+        if job.hwaccel == "cuda" and (job.cv or "").endswith("_nvenc") and not job.s:
+            command += ["-hwaccel_output_format", "cuda", "-extra_hw_frames", "4"]
+
+    _, input_options, low_latency = _MEM_PROFILES[job.mem_profile]
+    command += input_options
+    command += ["-i", job.input_file]
+
+    if job.outputs:
+        return command + _multi_output_options(job, low_latency)
+
+    if job.cv:
+        command += ["-c:v", job.cv]
+    if job.ca:
+        command += ["-c:a", job.ca]
+    if job.s:
+        command += ["-s", job.s.replace("×", "x")]
+    if job.ar:
+        command += ["-ar", str(job.ar)]
+    if job.ac:
+        command += ["-ac", str(job.ac)]
+    if job.ba:
+        command += ["-b:a", str(job.ba)]
+    if job.r:
+        command += ["-r", str(job.r)]
+    if job.f:
+        command += ["-f", job.f]
+    if job.preset:
+        command += ["-preset", job.preset]
+    if job.bv:
+        command += ["-b:v", str(job.bv)]
+    if job.threads:
+        command += ["-threads", str(job.threads)]
+    if low_latency and job.cv in _LOW_LATENCY_TUNES:
+        command += ["-tune", _LOW_LATENCY_TUNES[job.cv]]
+
+    if job.output_file:
+        command += ["-y", job.output_file]
+
+    return command
+
+
+def _multi_output_options(job: FfpeJob, low_latency: bool) -> List[str]:
+    """
+    >>> BUILD THE OUTPUT SIDE OF A MULTI-OUTPUT JOB. FFPE DECODES THE INPUT
+    >>> ONCE AND FEEDS EVERY OUTPUT; WHEN THE OUTPUTS NEED DIFFERENT
+    >>> RESOLUTIONS THE DECODED VIDEO IS SPLIT AND SCALED PER OUTPUT.
+    """
+    options = []
+    scales = [
+        resolution.replace("×", "x") if resolution else None
+        for _, _, _, resolution, _ in job.outputs
+    ]
+
+    if len(set(scales)) > 1:
+        labels = "".join(f"[v{i}]" for i in range(len(scales)))
+        graph = [f"[0:v]split={len(scales)}{labels}"]
+        video_maps = []
+        for i, scale in enumerate(scales):
+            if scale:
+                graph.append(f"[v{i}]scale={scale.replace('x', ':')}[s{i}]")
+                video_maps.append(f"[s{i}]")
+            else:
+                video_maps.append(f"[v{i}]")
+        options += ["-filter_complex", ";".join(graph)]
+        scales = [None] * len(scales)
     else:
-        _ = os.system("clear")  # FOR LINUX/MACOS
+        video_maps = ["0:v?"] * len(scales)
+
+    shared = []
+    if job.ca:
+        shared += ["-c:a", job.ca]
+    if job.ar:
+        shared += ["-ar", str(job.ar)]
+    if job.ac:
+        shared += ["-ac", str(job.ac)]
+    if job.ba:
+        shared += ["-b:a", str(job.ba)]
+    if job.r:
+        shared += ["-r", str(job.r)]
+    if job.threads:
+        shared += ["-threads", str(job.threads)]
+
+    for (path, codec, bitrate, _, preset), video_map, scale in zip(
+        job.outputs, video_maps, scales
+    ):
+        options += ["-map", video_map, "-map", "0:a?"]
+        if codec:
+            options += ["-c:v", codec]
+        if bitrate:
+            options += ["-b:v", str(bitrate)]
+        if preset:
+            options += ["-preset", preset]
+        if low_latency and codec in _LOW_LATENCY_TUNES:
+            options += ["-tune", _LOW_LATENCY_TUNES[codec]]
+        if scale:
+            options += ["-s", scale]
+        options += shared
+        options += ["-y", path]
+
+    return options
+
+
+class _FfpeRun:
+    """
+    >>> STATE OF ONE RUNNING FFPE PROCESS INSIDE THE REACTOR.
+    """
+
+    def __init__(self, job: FfpeJob, process, log_file):
+        self.job = job
+        self.process = process
+        self.log_file = log_file
+        self.duration_us = max(1, int(job.duration * 1_000_000))
+        # BYTES AFTER THE LAST NEWLINE, KEPT UNTIL THE REST OF THE LINE ARRIVES.
+        self.pending = bytearray()
+        self.last_percentage = -1
+
+
+class _FfpeReactor:
+    """
+    >>> RUN FFPE JOBS WITH AT MOST "WORKERS" PROCESSES ALIVE AND READ ALL OF
+    >>> THEIR "-progress" PIPES FROM ONE LOOP IN THE CALLING THREAD.
+
+    >>> PROGRESS IS REPORTED AS "report(INDEX, PERCENTAGE)", AND AS
+    >>> "report(INDEX, NONE)" ONCE A JOB IS DONE. AFTER "run()", "errors"
+    >>> HOLDS THE FFPE OUTPUT OF FAILED JOBS AND "failures" THE MESSAGES OF
+    >>> JOBS THAT COULD NOT BE STARTED.
+    """
+
+    def __init__(self, jobs: List[FfpeJob], workers: int, report=None):
+        self.jobs = deque(jobs)
+        self.workers = max(1, workers)
+        self.report = report
+        # RUNS WHOSE FFPE PROCESS HAS BEEN STARTED BUT NOT YET REAPED.
+        self.running = set()
+        self.errors: List[str] = []
+        self.failures: List[str] = []
+        # SELECT() ONLY WORKS ON SOCKETS ON WINDOWS, SO THERE EACH PIPE IS
+        # DRAINED BY A SMALL PUMP THREAD INTO ONE QUEUE INSTEAD.
+        if os.name == "nt":
+            self.selector = None
+            self.chunks = queue.Queue()
+        else:
+            self.selector = selectors.DefaultSelector()
+
+    def run(self) -> None:
+        try:
+            while self.jobs or self.running:
+                while self.jobs and len(self.running) < self.workers:
+                    self._start(self.jobs.popleft())
+                if self.running:
+                    for run, chunk in self._wait():
+                        self._feed(run, chunk)
+        finally:
+            # ANY RUN STILL HERE MEANS THE LOOP WAS INTERRUPTED (E.G. BY AN
+            # EXCEPTION FROM "report" OR CTRL+C), SO STOP AND REAP ITS FFPE.
+            for run in self.running:
+                try:
+                    run.process.terminate()
+                except OSError:
+                    pass
+                run.process.wait()
+                run.process.stdout.close()
+                run.log_file.close()
+            self.running.clear()
+            if self.selector is not None:
+                self.selector.close()
+
+    def _start(self, job: FfpeJob) -> None:
+        # PROGRESS ARRIVES AS "key=value" LINES ON STDOUT; THE LOG GOES TO A
+        # TEMPORARY FILE SO IT CAN BE CHECKED FOR ERRORS ONCE FFPE EXITS.
+        log_file = tempfile.TemporaryFile()
+        try:
+            process = subprocess.Popen(
+                _build_command(job),
+                stdout=subprocess.PIPE,
+                stderr=log_file,
+                shell=False,
+            )
+        except Exception as e:
+            log_file.close()
+            self.failures.append(f"AN ERROR OCCURRED: {e}")
+            if self.report:
+                self.report(job.index, None)
+            return
+
+        run = _FfpeRun(job, process, log_file)
+        self.running.add(run)
+        if self.selector is not None:
+            # NON-BLOCKING SO A SPURIOUS WAKE-UP CAN NEVER STALL THE WHOLE LOOP.
+            os.set_blocking(process.stdout.fileno(), False)
+            self.selector.register(process.stdout, selectors.EVENT_READ, run)
+        else:
+            threading.Thread(target=self._pump, args=(run,), daemon=True).start()
+
+    def _pump(self, run: _FfpeRun) -> None:
+        fd = run.process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, 65536)
+            self.chunks.put((run, chunk))
+            if not chunk:
+                return
+
+    def _wait(self):
+        if self.selector is None:
+            return [self.chunks.get()]
+        chunks = []
+        for key, _ in self.selector.select():
+            try:
+                chunks.append((key.data, os.read(key.fd, 65536)))
+            except BlockingIOError:
+                pass
+        return chunks
+
+    def _feed(self, run: _FfpeRun, chunk: bytes) -> None:
+        if not chunk:
+            self._finish(run)
+            return
+
+        # ONLY THE PART UP TO THE LAST NEWLINE IS SPLIT; THE PARTIAL LINE STAYS
+        # IN THE BUFFER AND IS EXTENDED IN PLACE BY THE NEXT CHUNK.
+        pending = run.pending
+        pending += chunk
+        end = pending.rfind(b"\n")
+        if end < 0:
+            return
+        lines = pending[:end].split(b"\n")
+        del pending[: end + 1]
+
+        for line in lines:
+            key, _, value = line.partition(b"=")
+            if key == b"out_time_us" and value[:1].isdigit():
+                progress_percentage = min(100, int(value) * 100 // run.duration_us)
+                if self.report and progress_percentage != run.last_percentage:
+                    self.report(run.job.index, progress_percentage)
+                    run.last_percentage = progress_percentage
+
+    def _finish(self, run: _FfpeRun) -> None:
+        if self.selector is not None:
+            self.selector.unregister(run.process.stdout)
+
+        # RELEASE THE PIPE AND REAP THE FFPE PROCESS.
+        run.process.stdout.close()
+        run.process.wait()
+        self.running.discard(run)
+
+        with run.log_file:
+            run.log_file.seek(0)
+            combined_output = run.log_file.read().decode("utf-8", "replace")
+
+        # Check if "error" is in the output
+        if run.process.returncode != 0 or "error" in combined_output.lower():
+            self.errors.append(combined_output)
+
+        if self.report:
+            self.report(run.job.index, None)
+
+
+def _print_ffpe_error(combined_output):
+    """
+    >>> PRINT THE FFPE OUTPUT OF A FAILED CONVERSION WITH AN EXPLANATION.
+    """
+    error_message = f"{combined_output.upper()}"  # Convert to uppercase and apply bold and red formatting
+    explanation = (
+        "1. MAKE SURE ALL ENTRIES ARE ACCURATELY FORMATTED AND SUPPORTED.\n"
+        "2. PLEASE MAKE SURE YOU HAVE PROVIDED VALID NAMES AND OPTIONS.\n"
+    )
+
+    error_message = Panel.fit(
+        Syntax(
+            f"{error_message}",
+            "ini",
+            theme="one-dark",
+            word_wrap=True,
+        ),
+        title="ERROR :Dizzy_Face:",
+        border_style="red",
+    )
+
+    explanation = Panel.fit(
+        Syntax(f"{explanation}", "yaml", theme="one-dark"),
+        title="EXPLANATION :thinking_face:",
+        border_style="green",
+        style="bold green",
+    )
+    console.print(error_message)
+    console.print(explanation)
 
 
 class ffpe:
@@ -129,6 +613,10 @@ class ffpe:
         ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
         ```
+    ⇨ CONVERT_MULTI( )
+    -------------------
+        >>> CONVERT ONE MEDIA FILE INTO SEVERAL OUTPUTS, DECODING IT ONLY ONCE.
+
     ⇨ CODEC'S( )
     -------------
         >>> GET INFORMATION ABOUT AVAILABLE CODECS USING FFMPEG.
@@ -145,30 +633,16 @@ class ffpe:
         """
         >>> INITIALIZE THE FFPE INSTANCE.
 
-        >>> SETS THE DEFAULT PATH TO THE FFMPEG EXECUTABLE AND INITIALIZES THE LOGGER.
+        >>> SETS THE DEFAULT PATH TO THE FFMPEG EXECUTABLE AND ATTACHES THE SHARED LOGGER.
         """
-        self.ffpe_path = Path(__file__).resolve().parent / "bin" / "ffpe.exe"
-        self.logger = self._initialize_logger()
-        self._ffprobe_path = Path(__file__).resolve().parent / "bin" / "ffpr.exe"
+        self.ffpe_path = FFPE_PATH
+        self.logger = logger
+        self._ffprobe_path = FFPR_PATH
         self.has_error = False
-
-    def _initialize_logger(self) -> logging.Logger:
-        """
-        >>> INITIALIZE THE LOGGER FOR LOGGING MESSAGES.
-
-        RETURNS:
-        --------
-
-        >>> LOGGING.LOGGER.
-            >>> LOGGER INSTANCE.
-        """
-        logger = logging.getLogger("ffpe_logger")
-        logger.setLevel(logging.INFO)
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
-        return logger
+        # PARSED ROWS OF "-codecs", "-formats", "-hwaccels" AND "encoder=..." OUTPUT.
+        self._info_cache = {}
+        # MEDIA DURATIONS KEYED BY (PATH, MTIME_NS, SIZE).
+        self._dur_cache: Dict[tuple, float] = {}
 
     def convert(
         self,
@@ -185,6 +659,7 @@ class ffpe:
         f: Optional[str] = None,
         preset: Optional[str] = None,
         bv: Optional[int] = None,
+        mem_profile: Literal["quality", "balanced", "low"] = "balanced",
     ) -> None:
         """
             >>> EXAMPLE:
@@ -258,6 +733,14 @@ class ffpe:
         ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
         ```
+        ⇨ MEM_PROFILE:
+        ---------------
+        >>> "quality"  ⇨ NO LIMITS, FFPE PICKS ITS OWN THREAD COUNT.
+        >>> "balanced" ⇨ 4 THREADS PER JOB WHEN JOBS SHARE THE CPU, MORE WHEN
+        >>>              THERE ARE FEWER JOBS THAN CORES (DEFAULT).
+        >>> "low"      ⇨ 2 THREADS PER JOB AND A LOW-LATENCY "-tune", ABOUT A THIRD
+        >>>              OF THE FRAME-BUFFER MEMORY, AT SOME COST IN QUALITY AND SPEED.
+
         ⇨ ADDITIONAL NOTE:
         -------------------
         >>> REMEMBER ALWAYS USE SQUARE [] BRACKETS FOR INPUT FILES PATH.
@@ -272,14 +755,24 @@ class ffpe:
             self.logger.error("ERROR: OUTPUT DIRECTORY NOT PROVIDED.")
             return
 
+        if mem_profile not in _MEM_PROFILES:
+            self.logger.error("ERROR: INVALID MEMORY PROFILE: %s", mem_profile)
+            return
+
         if not isinstance(input_files, list):
             input_files = [input_files]
 
+        # THE SAME INPUT LISTED TWICE WOULD WRITE THE SAME OUTPUT, SO EACH
+        # INPUT FILE IS CONVERTED ONCE.
+        input_files = list(dict.fromkeys(input_files))
+
         # CHECK IF THE INPUT FILES EXIST
-        for input_file in input_files:
-            if not os.path.exists(input_file):
-                self.logger.error(f"INVALID INPUT FILE PATH: {input_file}")
-                return
+        missing = _missing_files(input_files)
+        if missing:
+            self.logger.error(
+                "INVALID INPUT FILE PATH: %s", ", ".join(map(str, missing))
+            )
+            return
 
         # DISPLAY DIFFERENT MESSAGES BASED ON THE USER'S CHOICE
         if len(input_files) > 1:
@@ -297,49 +790,213 @@ class ffpe:
                 )
             )
 
+        # ENCODE ON THE GPU WHEN "HWACCEL" HAS A MATCHING HARDWARE ENCODER.
+        cv, preset = self._hw_encoder(hwaccel, cv, preset)
+        threads = _MEM_PROFILES[mem_profile][0]
+
+        jobs = []
+        output_prefix = os.path.join(output_dir, "")
         for i, input_file in enumerate(input_files, start=1):
             filename = os.path.basename(input_file)
-            output_file = os.path.join(
-                output_dir, f"{os.path.splitext(filename)[0]}.{f}"
+            output_file = f"{output_prefix}{os.path.splitext(filename)[0]}.{f}"
+            try:
+                duration = self.get_duration(input_file)
+            except Exception as e:
+                clear_console()
+                print(f"AN ERROR OCCURRED: {e}")
+                self.has_error = True
+                continue
+
+            jobs.append(
+                FfpeJob(
+                    ffpe_path=str(self.ffpe_path),
+                    input_file=input_file,
+                    output_file=output_file,
+                    duration=duration,
+                    index=i,
+                    cv=cv,
+                    ca=ca,
+                    s=s,
+                    hwaccel=hwaccel,
+                    ar=ar,
+                    ac=ac,
+                    ba=ba,
+                    r=r,
+                    f=f,
+                    preset=preset,
+                    bv=bv,
+                    threads=threads,
+                    mem_profile=mem_profile,
+                )
             )
 
-            # CREATE A NEW TQDM INSTANCE FOR EACH FILE CONVERSION.
-            progress_bar = tqdm(
-                total=100,
-                desc=f"⇨ CONVERTING [{i}]",
-                unit="%",
-                dynamic_ncols=True,
-                bar_format="{l_bar}{bar:40}| {n_fmt}/{total_fmt} - TIME: {elapsed}",
-                colour="green",
-            )
+        self._run_jobs(jobs, threads)
 
-            self.convert_single(
-                input_file,
-                output_file,
-                cv,
-                ca,
-                s,
-                hwaccel,
-                ar,
-                ac,
-                ba,
-                r,
-                f,
-                preset,
-                bv,
-                progress_bar,
+    def _run_jobs(self, jobs: List[FfpeJob], threads: Optional[int]) -> None:
+        """
+        >>> RUN THE JOBS THROUGH THE FFPE REACTOR WITH ONE SHARED PROGRESS
+        >>> DISPLAY, THEN REPORT ERRORS OR COMPLETION.
+        """
+        if not jobs:
+            return
+
+        # RUN AT MOST ONE FFPE JOB PER "THREADS" CORES SO THE ENCODERS DO
+        # NOT OVERSUBSCRIBE THE CPU.
+        cpus = os.cpu_count() or 1
+        workers = min(len(jobs), max(1, cpus // (threads or THREADS_PER_JOB)))
+
+        # WITH FEWER JOBS THAN WORKER SLOTS, "balanced" SPREADS THE SPARE CORES
+        # OVER THE JOBS THAT DO RUN. "low" KEEPS ITS CAP TO BOUND MEMORY.
+        if threads and jobs[0].mem_profile == "balanced":
+            threads = max(threads, cpus // workers)
+            jobs = [replace(job, threads=threads) for job in jobs]
+
+        # ONE RICH PROGRESS DRAWS EVERY JOB, WITH A TASK ADDED ON ITS FIRST UPDATE.
+        progress = Progress(
+            TextColumn("⇨ CONVERTING [{task.fields[idx]}]"),
+            BarColumn(bar_width=40),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        )
+        tasks = {}
+
+        def report(index, percentage):
+            task_id = tasks.get(index)
+            if task_id is None:
+                task_id = tasks[index] = progress.add_task("", total=100, idx=index)
+            progress.update(
+                task_id, completed=100 if percentage is None else percentage
             )
 
-            progress_bar.close()
-            print(" ")
+        reactor = _FfpeReactor(jobs, workers, report)
+        with progress:
+            reactor.run()
+        errors, failures = reactor.errors, reactor.failures
+
+        print(" ")
+
+        if errors or failures:
+            clear_console()
+            for error_output in errors:
+                _print_ffpe_error(error_output)
+            for failure in failures:
+                print(failure)
+            self.has_error = True
 
         if self.has_error:
             return
 
-        time.sleep(2)
+        # ONE SUMMARY LINE FOR THE WHOLE BATCH; THE PROGRESS DISPLAY HAS ALREADY
+        # DRAWN EVERY JOB AT 100%, SO THERE IS NOTHING TO PAUSE FOR.
         console.print("[bold green]⇨ FILE CONVERSION COMPLETED ✅[/bold green]")
 
-    @lru_cache(maxsize=None)
+    def convert_multi(
+        self,
+        input_file: Optional[str] = None,
+        outputs: Optional[List[dict]] = None,
+        ca: Optional[str] = None,
+        hwaccel: Optional[str] = None,
+        ar: Optional[int] = None,
+        ac: Optional[int] = None,
+        ba: Optional[int] = None,
+        r: Optional[int] = None,
+        preset: Optional[str] = None,
+        mem_profile: Literal["quality", "balanced", "low"] = "balanced",
+    ) -> None:
+        """
+        >>> CONVERT ONE MEDIA FILE INTO SEVERAL OUTPUTS WITH A SINGLE FFPE RUN.
+
+        >>> THE INPUT IS DECODED ONCE AND SHARED BY EVERY OUTPUT, INSTEAD OF
+        >>> ONCE PER OUTPUT. EACH OUTPUT IS A DICT WITH "path" AND OPTIONAL
+        >>> "codec", "bitrate" AND "resolution" KEYS.
+
+        >>> EXAMPLE:
+
+        ```python
+        ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        from MediaSwift import *
+        ffpe_instance = ffpe()
+
+        ffpe_instance.convert_multi(
+            input_file=r"PATH_TO_INPUT_FILE",
+            outputs=[
+                {"path": r"OUTPUT_1080.mp4", "codec": "h264", "bitrate": "8M", "resolution": "1920x1080"},
+                {"path": r"OUTPUT_720.mp4", "codec": "h264", "bitrate": "4M", "resolution": "1280x720"},
+            ],
+            ca="aac",         # AUDIO CODEC
+            hwaccel="cuda",   # HARDWARE ACCELERATION
+        )
+        ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        ```
+        >>> RETURNS: NONE
+        """
+        if not input_file:
+            self.logger.error("ERROR: NO INPUT FILE PROVIDED.")
+            return
+
+        if not outputs or not all(output.get("path") for output in outputs):
+            self.logger.error("ERROR: EVERY OUTPUT NEEDS A PATH.")
+            return
+
+        if mem_profile not in _MEM_PROFILES:
+            self.logger.error("ERROR: INVALID MEMORY PROFILE: %s", mem_profile)
+            return
+
+        if not os.path.exists(input_file):
+            self.logger.error("INVALID INPUT FILE PATH: %s", input_file)
+            return
+
+        clear_console()
+        console.print(
+            Panel.fit(
+                f"[bold yellow]😎 CONVERTING SINGLE MEDIA FILE ⇌  {len(outputs)} OUTPUTS[/bold yellow]",
+            )
+        )
+
+        try:
+            duration = self.get_duration(input_file)
+        except Exception as e:
+            clear_console()
+            print(f"AN ERROR OCCURRED: {e}")
+            self.has_error = True
+            return
+
+        # EACH OUTPUT MAY SWITCH TO A HARDWARE ENCODER, SO EACH CARRIES THE
+        # PRESET SPELLED THE WAY ITS OWN ENCODER ACCEPTS IT.
+        job_outputs = []
+        for output in outputs:
+            codec, output_preset = self._hw_encoder(
+                hwaccel, output.get("codec"), preset
+            )
+            job_outputs.append(
+                (
+                    output["path"],
+                    codec,
+                    output.get("bitrate"),
+                    output.get("resolution"),
+                    output_preset,
+                )
+            )
+
+        threads = _MEM_PROFILES[mem_profile][0]
+        job = FfpeJob(
+            ffpe_path=str(self.ffpe_path),
+            input_file=input_file,
+            output_file="",
+            duration=duration,
+            ca=ca,
+            hwaccel=hwaccel,
+            ar=ar,
+            ac=ac,
+            ba=ba,
+            r=r,
+            threads=threads,
+            mem_profile=mem_profile,
+            outputs=tuple(job_outputs),
+        )
+        self._run_jobs([job], threads)
+
     def convert_single(
         self,
         input_file: str,
@@ -356,6 +1013,8 @@ class ffpe:
         preset: Optional[str] = None,
         bv: Optional[int] = None,
         progress_bar: Optional[tqdm] = None,
+        threads: Optional[int] = None,
+        mem_profile: str = "quality",
     ) -> None:
         """
 
@@ -434,102 +1093,50 @@ class ffpe:
         >>> RETURNS: NONE
 
         """
-        # BUILD THE FFMPEG COMMAND BASED ON THE PROVIDED PARAMETERS.
-        command = [self.ffpe_path, "-hide_banner"]
-
-        if hwaccel:
-            command += ["-hwaccel", hwaccel]
-
-        command += ["-i", input_file]
-
-        if cv:
-            command += ["-c:v", cv]
-        if ca:
-            command += ["-c:a", ca]
-        if s:
-            s = s.replace("×", "x")
-            command += ["-s", s]
-        if ar:
-            command += ["-ar", str(ar)]
-        if ac:
-            command += ["-ac", str(ac)]
-        if ba:
-            command += ["-b:a", str(ba)]
-        if r:
-            command += ["-r", str(r)]
-        if f:
-            command += ["-f", f]
-        if preset:
-            command += ["-preset", preset]
-        if bv:
-            command += ["-b:v", str(bv)]
-
-        if output_file:
-            command += ["-y", output_file]
+        def report(index, percentage):
+            if progress_bar is None:
+                return
+            if percentage is None:
+                # Ensure the progress bar is at 100%
+                progress_bar.n = 100
+                progress_bar.refresh()
+            else:
+                progress_bar.update(percentage - progress_bar.n)
 
         try:
-            duration = self.get_duration(self, input_file)
-
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Capture both stdout and stderr
-                universal_newlines=True,
-                encoding="utf-8",
-                shell=True,
-                bufsize=1,
+            cv, preset = self._hw_encoder(hwaccel, cv, preset)
+            job = FfpeJob(
+                ffpe_path=str(self.ffpe_path),
+                input_file=input_file,
+                output_file=output_file,
+                duration=self.get_duration(input_file),
+                cv=cv,
+                ca=ca,
+                s=s,
+                hwaccel=hwaccel,
+                ar=ar,
+                ac=ac,
+                ba=ba,
+                r=r,
+                f=f,
+                preset=preset,
+                bv=bv,
+                threads=threads,
+                mem_profile=mem_profile,
             )
-
-            combined_output = ""  # Initialize combined_output here
-
-            for line in process.stdout:
-                combined_output += line
-                match = re.search(r"time=(\d+:\d+:\d+.\d+)", line)
-                if match:
-                    time_str = match.group(1)
-                    h, m, s = map(float, time_str.split(":"))
-                    elapsed_time = h * 3600 + m * 60 + s
-                    progress = min(elapsed_time / duration, 1.0)
-
-                    # Update tqdm progress
-                    progress_percentage = int(np.ceil(progress * 100))
-                    progress_bar.update(progress_percentage - progress_bar.n)
-
-            # Ensure the progress bar is at 100%
-            progress_bar.n = 100
-            progress_bar.refresh()
+            reactor = _FfpeReactor([job], 1, report)
+            reactor.run()
 
             # Close the progress bar
-            progress_bar.close()
+            if progress_bar is not None:
+                progress_bar.close()
 
-            if "error" in combined_output.lower():  # Check if "error" is in the output
+            if reactor.errors or reactor.failures:
                 clear_console()
-                error_message = f"{combined_output.upper()}"  # Convert to uppercase and apply bold and red formatting
-                explanation = (
-                    "1. MAKE SURE ALL ENTRIES ARE ACCURATELY FORMATTED AND SUPPORTED.\n"
-                    "2. PLEASE MAKE SURE YOU HAVE PROVIDED VALID NAMES AND OPTIONS.\n"
-                )
-
-                error_message = Panel.fit(
-                    Syntax(
-                        f"{error_message}",
-                        "ini",
-                        theme="one-dark",
-                        word_wrap=True,
-                    ),
-                    title="ERROR :Dizzy_Face:",
-                    border_style="red",
-                )
-
-                explanation = Panel.fit(
-                    Syntax(f"{explanation}", "yaml", theme="one-dark"),
-                    title="EXPLANATION :thinking_face:",
-                    border_style="green",
-                    style="bold green",
-                )
-                console.print(error_message)
-                console.print(explanation)
-            if "error" in combined_output.lower():
+                for error_output in reactor.errors:
+                    _print_ffpe_error(error_output)
+                for failure in reactor.failures:
+                    print(failure)
                 self.has_error = True
 
         except subprocess.CalledProcessError as e:
@@ -541,20 +1148,95 @@ class ffpe:
             print(f"AN ERROR OCCURRED: {e}")
             self.has_error = True
 
-        finally:
-            gc.collect()
-
-    @staticmethod
     def get_duration(self, file_path):
-        command = f'{self._ffprobe_path} -v error -show_entries stream=duration -of default=noprint_wrappers=1:nokey=1 "{file_path}"'
-        output = subprocess.check_output(command, shell=True).decode("utf-8").strip()
-        durations = np.fromstring(output, sep="\r\n")
-        return np.max(durations)
+        """
+        >>> RETURN THE DURATION OF THE MEDIA FILE IN SECONDS.
 
-    @lru_cache(maxsize=None)
-    def codecs(self, encoder: str = None) -> None:
+        >>> THE RESULT IS CACHED UNTIL THE FILE'S MTIME OR SIZE CHANGES.
+        """
+        st = os.stat(file_path)
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        duration = self._dur_cache.get(key)
+        if duration is not None:
+            return duration
+
+        command = [
+            self._ffprobe_path,
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            file_path,
+        ]
+        output = subprocess.check_output(command).decode("utf-8").strip()
+        duration = self._dur_cache[key] = float(output)
+        return duration
+
+    def _encoder_works(self, encoder: str) -> bool:
+        """
+        >>> TELL WHETHER "ENCODER" CAN ACTUALLY ENCODE ON THIS MACHINE, BY
+        >>> ENCODING ONE BLANK FRAME. BUILDS OFTEN LIST NVENC OR QSV EVEN
+        >>> WHERE THERE IS NO MATCHING GPU, SO "-encoders" IS NOT ENOUGH.
+        """
+        key = f"probe={encoder}"
+        works = self._info_cache.get(key)
+        if works is None:
+            command = [
+                self.ffpe_path,
+                *_BASE_OPTIONS,
+                "-v",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "nullsrc",
+                "-frames:v",
+                "1",
+                "-c:v",
+                encoder,
+                "-f",
+                "null",
+                "-",
+            ]
+            try:
+                result = subprocess.run(
+                    command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=30,
+                )
+                works = result.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                works = False
+            self._info_cache[key] = works
+        return works
+
+    def _hw_encoder(
+        self, hwaccel: Optional[str], cv: Optional[str], preset: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        >>> MAP THE VIDEO CODEC TO THE HARDWARE ENCODER OF "HWACCEL" AND THE
+        >>> PRESET TO THAT ENCODER'S NAME FOR IT. THE CODEC AND PRESET ARE
+        >>> RETURNED UNCHANGED WHEN THE PRESET HAS NO HARDWARE EQUIVALENT OR
+        >>> THE HARDWARE ENCODER FAILS A TEST ENCODE.
+        """
+        hw_encoder = _HW_ENCODER_MAP.get((hwaccel, cv))
+        if hw_encoder is None:
+            return cv, preset
+
+        hw_preset = None
+        if preset:
+            hw_preset = _HW_PRESETS[hw_encoder.rsplit("_", 1)[1]].get(preset)
+            if hw_preset is None:
+                return cv, preset
+
+        if not self._encoder_works(hw_encoder):
+            return cv, preset
+        return hw_encoder, hw_preset
 
-        # CALL THE GARBAGE COLLECTOR TO FREE UP RESOURCES.
+    def codecs(self, encoder: str = None) -> None:
         """
             >>> GET INFORMATION ABOUT AVAILABLE FORMATS USING FFMPEG.
 
@@ -573,19 +1255,62 @@ class ffpe:
 
         >>> RETURNS: NONE
         """
+        key = f"encoder={encoder}" if encoder else "-codecs"
         command = (
-            [self.ffpe_path, "-h", f"encoder={encoder}"]
-            if encoder
-            else [self.ffpe_path, "-codecs"]
+            [self.ffpe_path, "-h", key] if encoder else [self.ffpe_path, key]
         )
         console = Console()
 
         try:
-            result = subprocess.run(
-                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
-            )
-            output = result.stdout.decode("utf-8")
-            lines = output.split("\n")
+            rows = self._info_cache.get(key)
+            if rows is None:
+                result = subprocess.run(
+                    command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+                output = result.stdout.decode("utf-8")
+                lines = output.split("\n")
+
+                if encoder:
+                    # PARSE ENCODER PROPERTIES AND AVOPTIONS.
+                    properties, avoptions = [], []
+                    for line in lines[1:]:  # SKIP THE HEADER LINE
+                        if (
+                            line and ":" in line
+                        ):  # SKIP EMPTY LINES AND LINES WITHOUT A COLON
+                            property, value = line.split(":", 1)
+                            property = (
+                                property.strip().upper() if property.strip() else "NONE"
+                            )
+                            value = value.strip().upper() if value.strip() else "NONE"
+                            properties.append((property, value))
+
+                    for line in lines:
+                        if line.strip().startswith("-"):
+                            # Parse AVOptions
+                            property_value = line.strip().split(maxsplit=1)
+                            if len(property_value) == 2:
+                                property_name, property_value = property_value
+                                avoptions.append(
+                                    (property_name.upper(), property_value.upper())
+                                )
+                    rows = (properties, avoptions)
+                else:
+                    # PARSE GENERAL CODEC INFORMATION.
+                    rows = []
+                    for line in lines[11:]:  # Skip the header lines
+                        # FEATURES, NAME AND THE REST OF THE LINE AS DESCRIPTION.
+                        fields = line.split(None, 2)
+                        if len(fields) == 3 and len(fields[0]) == 6:
+                            features, codec_name, codec_description = fields
+                            rows.append(
+                                (
+                                    codec_name.upper(),
+                                    _CODEC_TYPES.get(features[2], ""),
+                                    codec_description.upper(),
+                                    _features_str(features),
+                                )
+                            )
+                self._info_cache[key] = rows
 
             clear_console()
 
@@ -602,16 +1327,8 @@ class ffpe:
                 )
                 table.add_column("PROPERTY", style="cyan")
                 table.add_column("VALUE", style="green")
-                for line in lines[1:]:  # SKIP THE HEADER LINE
-                    if (
-                        line and ":" in line
-                    ):  # SKIP EMPTY LINES AND LINES WITHOUT A COLON
-                        property, value = line.split(":", 1)
-                        property = (
-                            property.strip().upper() if property.strip() else "NONE"
-                        )
-                        value = value.strip().upper() if value.strip() else "NONE"
-                        table.add_row(property, value)
+                for row in rows[0]:
+                    table.add_row(*row)
 
                 console.print(table)
 
@@ -627,14 +1344,8 @@ class ffpe:
                 )
                 table.add_column("PROPERTY", style="cyan")
                 table.add_column("VALUE", style="green")
-
-                for line in lines:
-                    if line.strip().startswith("-"):
-                        # Parse AVOptions
-                        property_value = line.strip().split(maxsplit=1)
-                        if len(property_value) == 2:
-                            property_name, property_value = property_value
-                            table.add_row(property_name.upper(), property_value.upper())
+                for row in rows[1]:
+                    table.add_row(*row)
 
                 console.print(table)
 
@@ -648,32 +1359,8 @@ class ffpe:
                 table.add_column("DESCRIPTION", style="yellow", width=100)
                 table.add_column("FEATURES", style="cyan", width=20)
 
-                for line in lines[11:]:  # Skip the header lines
-                    if line:  # Skip empty lines
-                        fields = line.split()
-                        if len(fields) >= 4:  # Ensure there are enough fields
-                            codec_name = fields[1]
-                            codec_type = fields[2].strip("()")
-                            codec_description = " ".join(fields[3:])
-                            features = fields[0]
-
-                            features_str = (
-                                (".D" if "D" in features else "")
-                                + (".E" if "E" in features else "")
-                                + (".V" if "V" in features else "")
-                                + (".A" if "A" in features else "")
-                                + (".S" if "S" in features else "")
-                                + (".T" if "T" in features else "")
-                                + (".I" if "I" in features else "")
-                                + (".L" if "L" in features else "")
-                            )
-
-                            table.add_row(
-                                codec_name.upper(),
-                                codec_type.upper(),
-                                codec_description.upper(),
-                                features_str.upper(),
-                            )
+                for row in rows:
+                    table.add_row(*row)
 
                 legend = "\n".join(
                     [
@@ -702,11 +1389,8 @@ class ffpe:
             clear_console()
             console.print(f"[bold red]AN ERROR OCCURRED: {e}[/bold red]")
             return "-"
-        finally:
-            gc.collect()
 
-    @lru_cache(maxsize=None)
-    def formats(self) -> None:  # CALL THE GARBAGE COLLECTOR TO FREE UP RESOURCES.
+    def formats(self) -> None:
         """
             >>> GET INFORMATION ABOUT AVAILABLE FORMATS USING FFMPEG.
 
@@ -729,11 +1413,27 @@ class ffpe:
             # IMPORT THE TABLE CLASS.
             from rich.table import Table
 
-            result = subprocess.run(
-                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
-            )
-            output = result.stdout.decode("utf-8")
-            lines = output.split("\n")
+            rows = self._info_cache.get("-formats")
+            if rows is None:
+                result = subprocess.run(
+                    command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+                output = result.stdout.decode("utf-8")
+                lines = output.split("\n")
+
+                rows = []
+                for line in lines[5:]:  # SKIP THE HEADER LINES.
+                    # FEATURES, NAME AND THE REST OF THE LINE AS DESCRIPTION.
+                    fields = line.split(None, 2)
+                    if len(fields) >= 2:  # ENSURE THERE ARE ENOUGH FIELDS.
+                        rows.append(
+                            (
+                                fields[1].upper(),
+                                fields[2].upper() if len(fields) == 3 else "",
+                                _features_str(fields[0]),
+                            )
+                        )
+                self._info_cache["-formats"] = rows
 
             # USE RICH TABLE FOR FORMATTING.
             table = Table(show_header=True, header_style="bold magenta", box=ROUNDED)
@@ -741,32 +1441,9 @@ class ffpe:
             table.add_column("DESCRIPTION", style="yellow", width=50)
             table.add_column("FEATURES", style="cyan", width=50)
 
-            for line in lines[5:]:  # SKIP THE HEADER LINES.
-                if line:  # SKIP EMPTY LINES.
-                    fields = line.split()
-                    if len(fields) >= 2:  # ENSURE THERE ARE ENOUGH FIELDS.
-                        format_name = fields[1]
-                        format_description = " ".join(fields[2:])
-                        features = fields[0]
-
-                        # EXTRACTING ADDITIONAL FEATURES.
-                        features_str = (
-                            (".D" if "D" in features else "")
-                            + (".E" if "E" in features else "")
-                            + (".V" if "V" in features else "")
-                            + (".A" if "A" in features else "")
-                            + (".S" if "S" in features else "")
-                            + (".T" if "T" in features else "")
-                            + (".I" if "I" in features else "")
-                            + (".L" if "L" in features else "")
-                        )
-
-                        table.add_row(
-                            format_name.upper(),
-                            format_description.upper(),
-                            features_str.upper(),
-                        )
-                        clear_console()
+            for row in rows:
+                table.add_row(*row)
+            clear_console()
 
             legend = "\n".join(
                 [
@@ -788,10 +1465,7 @@ class ffpe:
             clear_console()
             console.print(f"[bold red]AN ERROR OCCURRED: {e}[/bold red]")
             return "-"
-        finally:
-            gc.collect()
 
-    @lru_cache(maxsize=None)
     def hwaccels(self) -> None:
         """
         >>> GET INFORMATION ABOUT AVAILABLE HARDWARE ACCELERATION METHODS USING FFPE.
@@ -811,19 +1485,24 @@ class ffpe:
         console = Console()
 
         try:
-            result = subprocess.run(
-                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
-            )
-            output = result.stdout.decode("utf-8")
-            hwaccels = output.strip().split("\n")
+            rows = self._info_cache.get("-hwaccels")
+            if rows is None:
+                result = subprocess.run(
+                    command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+                output = result.stdout.decode("utf-8")
+                hwaccels = output.strip().split("\n")
+
+                # SKIP THE FIRST LINE IN THE OUTPUT
+                rows = [hwaccel.upper() for hwaccel in hwaccels[1:]]
+                self._info_cache["-hwaccels"] = rows
 
             table = Table(show_header=True, header_style="bold magenta", box=ROUNDED)
             clear_console()
             table.add_column("HARDWARE ACCELERATION METHODS", style="cyan", width=50)
 
-            # SKIP THE FIRST LINE IN THE OUTPUT
-            for hwaccel in hwaccels[1:]:
-                table.add_row(hwaccel.upper())
+            for hwaccel in rows:
+                table.add_row(hwaccel)
             console.print(table)
 
             return "-"
@@ -835,10 +1514,7 @@ class ffpe:
             clear_console()
             console.print(f"[bold red]AN ERROR OCCURRED: {e}[/bold red]")
             return "-"
-        finally:
-            gc.collect()
 
-    @lru_cache(maxsize=None)
     def MediaClip(
         self,
         input_file: str,
@@ -898,7 +1574,7 @@ class ffpe:
             # BUILD THE FFMPEG COMMAND BASED ON THE PROVIDED PARAMETERS.
             command = [
                 self.ffpe_path,
-                "-hide_banner",
+                *_BASE_OPTIONS,
                 "-i",
                 input_file,
                 "-ss",
@@ -919,7 +1595,7 @@ class ffpe:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 encoding="utf-8",
-                shell=True,
+                shell=False,
                 bufsize=1,
                 universal_newlines=True,
             )
@@ -948,10 +1624,15 @@ class ffpe:
                         elapsed_time = m * 60 + s
                         progress = min(elapsed_time / duration_seconds, 1.0)
 
-                        # UPDATE TQDM PROGRESS USING NUMPY.CEIL TO ROUND UP
-                        progress_percentage = int(np.ceil(progress * 100))
+                        # UPDATE TQDM PROGRESS, ROUNDING UP TO THE NEXT PERCENT
+                        progress_percentage = -(-int(progress * 10000) // 100)
                         progress_bar.update(progress_percentage - progress_bar.n)
 
+            # RELEASE THE PIPES AND REAP THE FFPE PROCESS.
+            process.stderr.close()
+            process.stdout.close()
+            process.wait()
+
             console.print("[bold green]\n⇨ CONVERSION COMPLETED ✅[/bold green]")
 
             time.sleep(5)
@@ -966,8 +1647,3 @@ class ffpe:
         except Exception as e:
             clear_console()
             print(f"AN ERROR OCCURRED: {e}")
-        finally:
-            gc.collect()
-
-
-# CALL THE GARBAGE COLLECTOR TO FREE UP RESOURCES.
@@ -20,10 +20,10 @@ def clear_console():
     """
     >>> CLEAR SCREEN FUNCTION.
     """
-    if os.name == "nt":
-        _ = os.system("cls")  # FOR WINDOWS
+    if console.legacy_windows and console.is_terminal:
+        os.system("cls")
     else:
-        _ = os.system("clear")  # FOR LINUX/MACOS
+        console.clear()
 
 
 class ffpl:
@@ -223,7 +223,7 @@ class ffpl:
                     + (["-noborder"] if noborder else [])
                     + [str(media_file)]
                 )
-                os.system("cls" if os.name == "nt" else "clear")
+                clear_console()
                 console.print(
                     Panel.fit(
                         "MEDIA PLAYER. NOW PLAYING :Musical_Notes:", style="bold green"
@@ -236,7 +236,7 @@ class ffpl:
                     )
                 )
                 time.sleep(2)
-                os.system("cls" if os.name == "nt" else "clear")
+                clear_console()
         finally:
             console.print(
                 Panel.fit("MEDIA PLAYER EXITED.. :Waving_Hand:", style="bold yellow")
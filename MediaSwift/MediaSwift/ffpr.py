@@ -25,10 +25,10 @@ def clear_console():
     """
     >>> CLEAR SCREEN FUNCTION.
     """
-    if os.name == "nt":
-        _ = os.system("cls")  # FOR WINDOWS
+    if console.legacy_windows and console.is_terminal:
+        os.system("cls")
     else:
-        _ = os.system("clear")  # FOR LINUX/MACOS
+        console.clear()
 
 
 class FFProbeResult:
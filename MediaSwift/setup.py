@@ -41,7 +41,6 @@ setup(
     install_requires=[
         "rich",
         "tqdm",
-        "numpy",
     ],
     entry_points={
         "console_scripts": [